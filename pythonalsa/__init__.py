@@ -1,6 +1,6 @@
 """pythonalsa - ALSA C library bindings using ctypes for Python."""
 
-from .alsa import ALSAError, Card, Mixer, list_cards
+from .alsa import ALSAError, Card, Mixer, VolumePoller, list_cards
 
 __version__ = "0.1.2"
-__all__ = ["ALSAError", "Card", "Mixer", "list_cards"]
+__all__ = ["ALSAError", "Card", "Mixer", "VolumePoller", "list_cards"]
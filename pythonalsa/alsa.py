@@ -1,18 +1,27 @@
 """ALSA C library bindings using ctypes."""
 
-from contextlib import contextmanager
+import select
 from ctypes import (
     CDLL,
+    POINTER,
+    Array,
+    Structure,
+    c_char,
     c_char_p,
     c_int,
     c_long,
+    c_short,
+    c_size_t,
+    c_uint,
+    c_ushort,
     c_void_p,
     byref,
     create_string_buffer,
+    memset,
 )
 from ctypes.util import find_library
-from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
+from threading import local
 from typing import Iterator
 
 _lib = CDLL(find_library("asound"))
@@ -24,13 +33,94 @@ mixer_t = c_void_p
 mixer_elem_t = c_void_p
 mixer_selem_id_t = c_void_p
 
-# Configure return types for functions that return pointers
-_lib.snd_strerror.restype = c_char_p
-_lib.snd_ctl_card_info_get_name.restype = c_char_p
-_lib.snd_mixer_first_elem.restype = c_void_p
-_lib.snd_mixer_elem_next.restype = c_void_p
-_lib.snd_mixer_find_selem.restype = c_void_p
-_lib.snd_mixer_selem_id_get_name.restype = c_char_p
+
+class _PollFd(Structure):
+    """struct pollfd, as filled in by snd_mixer_poll_descriptors."""
+
+    _fields_ = [("fd", c_int), ("events", c_short), ("revents", c_short)]
+
+
+# Prototypes (restype, argtypes) for every libasound function we call, declared
+# once so ctypes doesn't have to infer argument conversions on each call
+_PROTOTYPES = {
+    "snd_strerror": (c_char_p, [c_int]),
+    "snd_card_get_index": (c_int, [c_char_p, POINTER(c_int)]),
+    "snd_card_next": (c_int, [POINTER(c_int)]),
+    "snd_ctl_open": (c_int, [POINTER(ctl_t), c_char_p, c_int]),
+    "snd_ctl_close": (c_int, [ctl_t]),
+    "snd_ctl_card_info": (c_int, [ctl_t, ctl_card_info_t]),
+    "snd_ctl_card_info_sizeof": (c_size_t, []),
+    "snd_ctl_card_info_get_name": (c_char_p, [ctl_card_info_t]),
+    "snd_mixer_open": (c_int, [POINTER(mixer_t), c_int]),
+    "snd_mixer_attach": (c_int, [mixer_t, c_char_p]),
+    "snd_mixer_selem_register": (c_int, [mixer_t, c_void_p, c_void_p]),
+    "snd_mixer_load": (c_int, [mixer_t]),
+    "snd_mixer_close": (c_int, [mixer_t]),
+    "snd_mixer_handle_events": (c_int, [mixer_t]),
+    "snd_mixer_poll_descriptors_count": (c_int, [mixer_t]),
+    "snd_mixer_poll_descriptors": (c_int, [mixer_t, POINTER(_PollFd), c_uint]),
+    "snd_mixer_poll_descriptors_revents": (
+        c_int,
+        [mixer_t, POINTER(_PollFd), c_uint, POINTER(c_ushort)],
+    ),
+    "snd_mixer_first_elem": (mixer_elem_t, [mixer_t]),
+    "snd_mixer_elem_next": (mixer_elem_t, [mixer_elem_t]),
+    "snd_mixer_find_selem": (mixer_elem_t, [mixer_t, mixer_selem_id_t]),
+    "snd_mixer_selem_get_id": (None, [mixer_elem_t, mixer_selem_id_t]),
+    "snd_mixer_selem_id_sizeof": (c_size_t, []),
+    "snd_mixer_selem_id_set_name": (None, [mixer_selem_id_t, c_char_p]),
+    "snd_mixer_selem_id_set_index": (None, [mixer_selem_id_t, c_int]),
+    "snd_mixer_selem_id_get_name": (c_char_p, [mixer_selem_id_t]),
+    "snd_mixer_selem_id_get_index": (c_int, [mixer_selem_id_t]),
+    "snd_mixer_selem_has_playback_volume": (c_int, [mixer_elem_t]),
+    "snd_mixer_selem_has_playback_switch": (c_int, [mixer_elem_t]),
+    "snd_mixer_selem_get_playback_volume_range": (
+        c_int,
+        [mixer_elem_t, POINTER(c_long), POINTER(c_long)],
+    ),
+    "snd_mixer_selem_get_playback_volume": (
+        c_int,
+        [mixer_elem_t, c_int, POINTER(c_long)],
+    ),
+    "snd_mixer_selem_set_playback_volume_all": (c_int, [mixer_elem_t, c_long]),
+    "snd_mixer_selem_get_playback_switch": (
+        c_int,
+        [mixer_elem_t, c_int, POINTER(c_int)],
+    ),
+    "snd_mixer_selem_set_playback_switch_all": (c_int, [mixer_elem_t, c_int]),
+}
+
+for _name, (_restype, _argtypes) in _PROTOTYPES.items():
+    _func = getattr(_lib, _name)
+    _func.restype = _restype
+    _func.argtypes = _argtypes
+del _name, _restype, _argtypes, _func
+
+# Sizes of opaque libasound structs are fixed for the loaded library
+_SELEM_ID_SIZE = _lib.snd_mixer_selem_id_sizeof()
+_CARD_INFO_SIZE = _lib.snd_ctl_card_info_sizeof()
+
+
+class _Scratch(local):
+    """Per-thread buffers reused across libasound calls instead of reallocated."""
+
+    def __init__(self) -> None:
+        self.selem_id = create_string_buffer(_SELEM_ID_SIZE)
+        # Output arguments for libasound getters
+        self.volume = c_long()
+        self.vmin = c_long()
+        self.vmax = c_long()
+        self.switch = c_int()
+
+
+_scratch = _Scratch()
+
+
+def _selem_id_buffer() -> Array[c_char]:
+    """Get this thread's zeroed, reusable snd_mixer_selem_id_t buffer."""
+    sid = _scratch.selem_id
+    memset(sid, 0, _SELEM_ID_SIZE)
+    return sid
 
 
 class ALSAError(Exception):
@@ -39,20 +129,125 @@ class ALSAError(Exception):
     pass
 
 
-def _check_error(err: int, summary: str) -> None:
-    """Check error code and raise ALSAError if negative."""
-    if err < 0:
-        message = _lib.snd_strerror(err).decode()
-        raise ALSAError(f"{summary}: {message}")
+@lru_cache(maxsize=64)
+def _strerror(err: int) -> str:
+    """Get the (cached) ALSA message for a negative error code."""
+    return _lib.snd_strerror(err).decode()
+
+
+def _alsa_error(err: int, summary: str) -> ALSAError:
+    """Build an ALSAError for a negative error code."""
+    return ALSAError(f"{summary}: {_strerror(err)}")
+
+
+class _MixerHandleContext:
+    """Context manager returning a card's mixer handle on entry."""
+
+    __slots__ = ("card", "handle")
+
+    def __init__(self, card: "Card"):
+        self.card = card
+        self.handle: mixer_t | None = None
+
+    def __enter__(self) -> mixer_t:
+        card = self.card
+        if not card.cached:
+            self.handle = card._open_mixer_handle()
+            return self.handle
+
+        if card._mixer_handle is None:
+            card._mixer_handle = card._open_mixer_handle()
+        else:
+            card._handle_events(card._mixer_handle)
+        return card._mixer_handle
+
+    def __exit__(self, *exc_info) -> None:
+        # Only handles opened by this context are closed; a cached card's
+        # handle outlives it
+        if self.handle is not None:
+            _lib.snd_mixer_close(self.handle)
+            self.handle = None
+
+
+class _ElemContext(_MixerHandleContext):
+    """Context manager returning a mixer's element handle on entry."""
+
+    __slots__ = ("mixer",)
+
+    def __init__(self, mixer: "Mixer"):
+        super().__init__(mixer.card)
+        self.mixer = mixer
+
+    def __enter__(self) -> mixer_elem_t:
+        handle = super().__enter__()
+        try:
+            return self._find_elem(handle)
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+
+    def _find_elem(self, handle: mixer_t) -> mixer_elem_t:
+        mixer = self.mixer
+        card = self.card
+        key = (mixer.name, mixer.index)
+        elem = card._elem_cache.get(key)
+        if elem is None:
+            elem = mixer._find_elem(handle)
+            if card.cached:
+                card._elem_cache[key] = elem
+        return elem
 
 
-@dataclass
 class Mixer:
     """Represents an ALSA mixer element."""
 
-    card: "Card"
-    name: str
-    index: int = 0
+    __slots__ = (
+        "card",
+        "_name",
+        "index",
+        "_name_bytes",
+    )
+
+    def __init__(self, card: "Card", name: str, index: int = 0):
+        self.card = card
+        self.name = name
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._name_bytes = value.encode("utf-8")
+
+    def _read_volume(self, elem: mixer_elem_t) -> int:
+        """Get the raw playback volume of an element known to support it."""
+        value = _scratch.volume
+        err = _lib.snd_mixer_selem_get_playback_volume(elem, 0, byref(value))
+        if err < 0:
+            raise _alsa_error(err, "Failed to get playback volume")
+        return value.value
+
+    def _read_volume_range(self, elem: mixer_elem_t) -> tuple[int, int]:
+        """Get the (min, max) playback volume of an element known to support it."""
+        pmin = _scratch.vmin
+        pmax = _scratch.vmax
+        _lib.snd_mixer_selem_get_playback_volume_range(elem, byref(pmin), byref(pmax))
+        return pmin.value, pmax.value
+
+    def __repr__(self) -> str:
+        return f"Mixer(card={self.card!r}, name={self.name!r}, index={self.index!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.card, self.name, self.index) == (
+            other.card,
+            other.name,
+            other.index,
+        )
 
     @property
     def has_volume_control(self) -> bool:
@@ -84,37 +279,49 @@ class Mixer:
         Returns:
             Tuple of (min, max) volume levels, or (None, None) if element doesn't support playback volume
         """
-        if not self.has_volume_control:
-            return None, None
         with self._make_alsa_elem() as elem:
-            pmin = c_long()
-            pmax = c_long()
-            _lib.snd_mixer_selem_get_playback_volume_range(
-                elem, byref(pmin), byref(pmax)
-            )
-            return pmin.value, pmax.value
+            if not _lib.snd_mixer_selem_has_playback_volume(elem):
+                return None, None
+            return self._read_volume_range(elem)
+
+    def _find_elem(self, handle: mixer_t) -> mixer_elem_t:
+        """
+        Look up this mixer's element on an open mixer handle.
+
+        Raises:
+            ALSAError: If the element doesn't exist
+        """
+        sid = _selem_id_buffer()
+        _lib.snd_mixer_selem_id_set_name(sid, self._name_bytes)
+        _lib.snd_mixer_selem_id_set_index(sid, self.index)
+        elem = _lib.snd_mixer_find_selem(handle, sid)
+        if not elem:
+            raise ALSAError(f"Mixer element '{self.name}' index {self.index} not found")
+        return elem
+
+    def make_poller(self) -> "VolumePoller":
+        """
+        Create a poller for repeatedly reading this mixer's volume percentage.
 
-    @contextmanager
-    def _make_alsa_elem(self) -> Iterator[mixer_elem_t]:
+        Returns:
+            VolumePoller holding its own open mixer handle
+
+        Raises:
+            ALSAError: If unable to access mixer element or element doesn't support playback volume
+        """
+        return VolumePoller(self)
+
+    def _make_alsa_elem(self) -> _ElemContext:
         """
         Context manager for accessing the mixer element.
 
-        Yields:
-            Mixer element handle
+        Returns:
+            Context manager yielding the mixer element handle
 
         Raises:
             ALSAError: If unable to access mixer element
         """
-        with self.card.make_alsa_mixer_handle() as handle:
-            sid = create_string_buffer(_lib.snd_mixer_selem_id_sizeof())
-            _lib.snd_mixer_selem_id_set_name(sid, self.name.encode("utf-8"))
-            _lib.snd_mixer_selem_id_set_index(sid, self.index)
-            elem = _lib.snd_mixer_find_selem(handle, sid)
-            if not elem:
-                raise ALSAError(
-                    f"Mixer element '{self.name}' index {self.index} not found"
-                )
-            yield elem
+        return _ElemContext(self)
 
     @property
     def volume(self) -> int | None:
@@ -127,16 +334,10 @@ class Mixer:
         Raises:
             ALSAError: If unable to get volume
         """
-        if not self.has_volume_control:
-            return None
-
         with self._make_alsa_elem() as elem:
-            value = c_long()
-            _check_error(
-                _lib.snd_mixer_selem_get_playback_volume(elem, 0, byref(value)),
-                "Failed to get playback volume",
-            )
-            return value.value
+            if not _lib.snd_mixer_selem_has_playback_volume(elem):
+                return None
+            return self._read_volume(elem)
 
     @volume.setter
     def volume(self, value: int) -> None:
@@ -149,15 +350,14 @@ class Mixer:
         Raises:
             ALSAError: If unable to set volume or element doesn't support playback volume
         """
-        if not self.has_volume_control:
-            raise ALSAError(
-                f"Mixer element '{self.name}' doesn't support playback volume"
-            )
         with self._make_alsa_elem() as elem:
-            _check_error(
-                _lib.snd_mixer_selem_set_playback_volume_all(elem, value),
-                "Failed to set playback volume",
-            )
+            if not _lib.snd_mixer_selem_has_playback_volume(elem):
+                raise ALSAError(
+                    f"Mixer element '{self.name}' doesn't support playback volume"
+                )
+            err = _lib.snd_mixer_selem_set_playback_volume_all(elem, value)
+            if err < 0:
+                raise _alsa_error(err, "Failed to set playback volume")
 
     @property
     def volume_percent(self) -> int | None:
@@ -170,14 +370,16 @@ class Mixer:
         Raises:
             ALSAError: If unable to get volume
         """
-        raw_vol = self.volume
-        if raw_vol is None:
-            return None
+        with self._make_alsa_elem() as elem:
+            if not _lib.snd_mixer_selem_has_playback_volume(elem):
+                return None
+            raw_vol = self._read_volume(elem)
+            vmin, vmax = self._read_volume_range(elem)
 
-        vmin, vmax = self.volume_range
-        if vmax == vmin:
+        span = vmax - vmin
+        if not span:
             return 0
-        return round((raw_vol - vmin) * 100 / (vmax - vmin))
+        return ((raw_vol - vmin) * 100 + span // 2) // span
 
     @volume_percent.setter
     def volume_percent(self, value: int) -> None:
@@ -193,15 +395,19 @@ class Mixer:
         """
         if not 0 <= value <= 100:
             raise ValueError(f"Volume must be between 0 and 100, got {value}")
+        # Keep the raw volume arithmetic below in integers
+        value = round(value)
 
-        vmin, vmax = self.volume_range
-        if vmin is None or vmax is None:
-            raise ALSAError(
-                f"Mixer element '{self.name}' doesn't support playback volume"
-            )
-
-        raw_vol = round(vmin + (value * (vmax - vmin) / 100))
-        self.volume = raw_vol
+        with self._make_alsa_elem() as elem:
+            if not _lib.snd_mixer_selem_has_playback_volume(elem):
+                raise ALSAError(
+                    f"Mixer element '{self.name}' doesn't support playback volume"
+                )
+            vmin, vmax = self._read_volume_range(elem)
+            raw_vol = vmin + (value * (vmax - vmin) + 50) // 100
+            err = _lib.snd_mixer_selem_set_playback_volume_all(elem, raw_vol)
+            if err < 0:
+                raise _alsa_error(err, "Failed to set playback volume")
 
     @property
     def muted(self) -> bool | None:
@@ -214,14 +420,13 @@ class Mixer:
         Raises:
             ALSAError: If unable to get mute state
         """
-        if not self.has_mute_control:
-            return None
         with self._make_alsa_elem() as elem:
-            value = c_int()
-            _check_error(
-                _lib.snd_mixer_selem_get_playback_switch(elem, 0, byref(value)),
-                "Failed to get playback switch",
-            )
+            if not _lib.snd_mixer_selem_has_playback_switch(elem):
+                return None
+            value = _scratch.switch
+            err = _lib.snd_mixer_selem_get_playback_switch(elem, 0, byref(value))
+            if err < 0:
+                raise _alsa_error(err, "Failed to get playback switch")
             unmuted = bool(value.value)
             return not unmuted
 
@@ -236,30 +441,121 @@ class Mixer:
         Raises:
             ALSAError: If unable to set mute state or element doesn't support mute
         """
-        if not self.has_mute_control:
-            raise ALSAError(
-                f"Mixer element '{self.name}' doesn't support playback switch"
-            )
         with self._make_alsa_elem() as elem:
-            _check_error(
-                _lib.snd_mixer_selem_set_playback_switch_all(elem, int(not value)),
-                "Failed to set playback switch",
-            )
+            if not _lib.snd_mixer_selem_has_playback_switch(elem):
+                raise ALSAError(
+                    f"Mixer element '{self.name}' doesn't support playback switch"
+                )
+            err = _lib.snd_mixer_selem_set_playback_switch_all(elem, int(not value))
+            if err < 0:
+                raise _alsa_error(err, "Failed to set playback switch")
+
+
+class VolumePoller:
+    """
+    Reads a mixer's volume percentage with as little work per read as possible.
+
+    The mixer handle, element and volume range are set up once on creation, so
+    each read() only processes pending mixer events and fetches the volume.
+    The handle stays open until close() is called or the poller is used as a
+    context manager and exits.
+    """
+
+    __slots__ = ("mixer", "_handle", "_elem", "_vmin", "_span")
+
+    def __init__(self, mixer: Mixer):
+        """
+        Create a VolumePoller instance.
+
+        Args:
+            mixer: Mixer to poll
+
+        Raises:
+            ALSAError: If unable to access mixer element or element doesn't support playback volume
+        """
+        self.mixer = mixer
+        self._handle: mixer_t | None = None
+        handle = mixer.card._open_mixer_handle()
+        try:
+            elem = mixer._find_elem(handle)
+            if not _lib.snd_mixer_selem_has_playback_volume(elem):
+                raise ALSAError(
+                    f"Mixer element '{mixer.name}' doesn't support playback volume"
+                )
+            vmin, vmax = mixer._read_volume_range(elem)
+        except BaseException:
+            _lib.snd_mixer_close(handle)
+            raise
+        self._handle = handle
+        self._elem = elem
+        self._vmin = vmin
+        self._span = vmax - vmin
+
+    def __enter__(self) -> "VolumePoller":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Module globals may already be cleared at interpreter shutdown
+        if _lib is not None and getattr(self, "_handle", None) is not None:
+            self.close()
+
+    def close(self) -> None:
+        """Release the poller's mixer handle."""
+        self._elem = None
+        if self._handle is not None:
+            _lib.snd_mixer_close(self._handle)
+            self._handle = None
+
+    def read(self) -> int:
+        """
+        Get current volume as percentage (0-100).
+
+        Returns:
+            Volume percentage
+
+        Raises:
+            ALSAError: If the poller is closed or unable to get volume
+        """
+        if self._handle is None:
+            raise ALSAError("VolumePoller is closed")
+        events = _lib.snd_mixer_handle_events(self._handle)
+        if events < 0:
+            raise _alsa_error(events, "Failed to handle mixer events")
+        if events:
+            # The element may have been removed; look it up again
+            self._elem = self.mixer._find_elem(self._handle)
+        value = _scratch.volume
+        err = _lib.snd_mixer_selem_get_playback_volume(self._elem, 0, byref(value))
+        if err < 0:
+            raise _alsa_error(err, "Failed to get playback volume")
+        span = self._span
+        if not span:
+            return 0
+        return ((value.value - self._vmin) * 100 + span // 2) // span
 
 
 class Card:
     """Represents an ALSA sound card."""
 
-    def __init__(self, index: int | None = None):
+    def __init__(self, index: int | None = None, cached: bool = False):
         """
         Create a Card instance.
 
         Args:
             index: Card index, or None to use the default card
+            cached: Keep one mixer handle open (and element lookups cached)
+                across accesses instead of reopening the mixer every time.
+                Call close() or use the card as a context manager to release it.
 
         Raises:
             ALSAError: If default card is requested but doesn't exist
         """
+        self.cached = cached
+        self._mixer_handle: mixer_t | None = None
+        self._elem_cache: dict[tuple[str, int], int] = {}
         if index is None:
             card_index = c_int()
             err = _lib.snd_card_get_index(b"default", byref(card_index))
@@ -269,6 +565,18 @@ class Card:
         else:
             self.index = index
 
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @index.setter
+    def index(self, value: int) -> None:
+        # Anything cached for the previous card no longer applies
+        self.close()
+        self.__dict__.pop("name", None)
+        self._index = value
+        self._device_bytes = self.device.encode("utf-8")
+
     @property
     def device(self) -> str:
         return f"hw:{self.index}"
@@ -285,84 +593,217 @@ class Card:
             ALSAError: If unable to get card info
         """
         handle = ctl_t()
-        _check_error(
-            _lib.snd_ctl_open(byref(handle), self.device.encode("utf-8"), 0),
-            f"Failed to open control interface [{self.device}]",
-        )
+        err = _lib.snd_ctl_open(byref(handle), self._device_bytes, 0)
+        if err < 0:
+            raise _alsa_error(err, f"Failed to open control interface [{self.device}]")
         try:
-            info = create_string_buffer(_lib.snd_ctl_card_info_sizeof())
-            _check_error(
-                _lib.snd_ctl_card_info(handle, info), "Failed to get card info"
-            )
+            info = create_string_buffer(_CARD_INFO_SIZE)
+            err = _lib.snd_ctl_card_info(handle, info)
+            if err < 0:
+                raise _alsa_error(err, "Failed to get card info")
             return _lib.snd_ctl_card_info_get_name(info).decode()
         finally:
             _lib.snd_ctl_close(handle)
 
-    @contextmanager
-    def make_alsa_mixer_handle(self) -> Iterator[mixer_t]:
+    def __enter__(self) -> "Card":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Module globals may already be cleared at interpreter shutdown
+        if _lib is not None and getattr(self, "_mixer_handle", None) is not None:
+            self.close()
+
+    def close(self) -> None:
+        """Release the cached mixer handle, if one is open."""
+        self._elem_cache.clear()
+        if self._mixer_handle is not None:
+            _lib.snd_mixer_close(self._mixer_handle)
+            self._mixer_handle = None
+
+    def _open_mixer_handle(self) -> mixer_t:
         """
-        Context manager for accessing the card's mixer handle.
+        Open, attach and load a new mixer handle for this card.
 
-        Yields:
-            Mixer handle
+        Returns:
+            Mixer handle, which the caller must close
 
         Raises:
             ALSAError: If unable to open mixer
         """
         handle = mixer_t()
-        _check_error(_lib.snd_mixer_open(byref(handle), 0), "Failed to open mixer")
+        err = _lib.snd_mixer_open(byref(handle), 0)
+        if err < 0:
+            raise _alsa_error(err, "Failed to open mixer")
         try:
-            _check_error(
-                _lib.snd_mixer_attach(handle, self.device.encode("utf-8")),
-                f"Failed to attach mixer to {self.device}",
-            )
-            _check_error(
-                _lib.snd_mixer_selem_register(handle, None, None),
-                "Failed to register mixer elements",
-            )
-            _check_error(_lib.snd_mixer_load(handle), "Failed to load mixer elements")
-            yield handle
-        finally:
+            err = _lib.snd_mixer_attach(handle, self._device_bytes)
+            if err < 0:
+                raise _alsa_error(err, f"Failed to attach mixer to {self.device}")
+            err = _lib.snd_mixer_selem_register(handle, None, None)
+            if err < 0:
+                raise _alsa_error(err, "Failed to register mixer elements")
+            err = _lib.snd_mixer_load(handle)
+            if err < 0:
+                raise _alsa_error(err, "Failed to load mixer elements")
+        except BaseException:
             _lib.snd_mixer_close(handle)
+            raise
+        return handle
 
-    def iter_mixers(self) -> Iterator[Mixer]:
+    def make_alsa_mixer_handle(self) -> _MixerHandleContext:
         """
-        Iterate over all mixer elements for this card.
+        Context manager for accessing the card's mixer handle.
 
-        Yields:
+        For a cached card the handle stays open after the block exits; pending
+        mixer events are processed on each entry so element values stay fresh.
+
+        Returns:
+            Context manager yielding the mixer handle
+
+        Raises:
+            ALSAError: If unable to open mixer
+        """
+        return _MixerHandleContext(self)
+
+    def wait_for_event(self, timeout: float | None = None) -> bool:
+        """
+        Wait until the card's mixer reports a change (volume, mute, etc.).
+
+        Events are processed before returning, so subsequent Mixer reads on
+        this card return the updated values. Only available on a cached card.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+
+        Returns:
+            True if mixer events were handled, False if the timeout expired or
+            the mixer woke up without any events to handle
+
+        Raises:
+            ALSAError: If the card isn't cached, the mixer has no poll
+                descriptors, or unable to poll the mixer
+        """
+        if not self.cached:
+            raise ALSAError("wait_for_event requires a card created with cached=True")
+        if self._mixer_handle is None:
+            self._mixer_handle = self._open_mixer_handle()
+        handle = self._mixer_handle
+
+        # Changes that arrived since the last access count as events too
+        if self._handle_events(handle):
+            return True
+
+        count = _lib.snd_mixer_poll_descriptors_count(handle)
+        if count < 0:
+            raise _alsa_error(count, "Failed to get mixer poll descriptors")
+        if not count:
+            raise ALSAError(f"Mixer for {self.device} has no poll descriptors")
+        pfds = (_PollFd * count)()
+        count = _lib.snd_mixer_poll_descriptors(handle, pfds, count)
+        if count < 0:
+            raise _alsa_error(count, "Failed to get mixer poll descriptors")
+        poller = select.poll()
+        for pfd in pfds[:count]:
+            poller.register(pfd.fd, pfd.events)
+        ready = dict(poller.poll(None if timeout is None else timeout * 1000))
+        if not ready:
+            return False
+
+        # Let libasound interpret what poll() reported for its descriptors
+        for pfd in pfds[:count]:
+            pfd.revents = ready.get(pfd.fd, 0)
+        revents = c_ushort()
+        err = _lib.snd_mixer_poll_descriptors_revents(
+            handle, pfds, count, byref(revents)
+        )
+        if err < 0:
+            raise _alsa_error(err, "Failed to get mixer poll events")
+        if revents.value & (select.POLLERR | select.POLLNVAL):
+            raise ALSAError(f"Error polling mixer for {self.device}")
+        return bool(self._handle_events(handle))
+
+    def _handle_events(self, handle: mixer_t) -> int:
+        """
+        Process pending events on the cached mixer handle.
+
+        Returns:
+            Number of events handled
+
+        Raises:
+            ALSAError: If unable to handle mixer events
+        """
+        events = _lib.snd_mixer_handle_events(handle)
+        if events < 0:
+            raise _alsa_error(events, "Failed to handle mixer events")
+        if events:
+            # Elements may have been removed; look them up again
+            self._elem_cache.clear()
+        return events
+
+    def list_mixers(self) -> list[Mixer]:
+        """
+        List all mixer elements for this card.
+
+        The elements are enumerated in one pass and the mixer handle is
+        released before returning.
+
+        Returns:
             Mixer objects for this card.
 
         Raises:
             ALSAError: If there's an error accessing the card's mixers.
         """
+        get_id = _lib.snd_mixer_selem_get_id
+        get_name = _lib.snd_mixer_selem_id_get_name
+        get_index = _lib.snd_mixer_selem_id_get_index
+        elem_next = _lib.snd_mixer_elem_next
+        ids = []
         with self.make_alsa_mixer_handle() as handle:
+            sid = _selem_id_buffer()
             elem = _lib.snd_mixer_first_elem(handle)
             while elem:
-                sid = create_string_buffer(_lib.snd_mixer_selem_id_sizeof())
-                _lib.snd_mixer_selem_get_id(elem, sid)
-                name = _lib.snd_mixer_selem_id_get_name(sid).decode()
-                index = _lib.snd_mixer_selem_id_get_index(sid)
-                yield Mixer(card=self, name=name, index=index)
-                elem = _lib.snd_mixer_elem_next(elem)
+                get_id(elem, sid)
+                ids.append((get_name(sid), get_index(sid)))
+                elem = elem_next(elem)
+        return [Mixer(self, name.decode(), index) for name, index in ids]
+
+    def iter_mixers(self) -> Iterator[Mixer]:
+        """
+        Iterate over all mixer elements for this card.
 
-    def get_mixer(self, name: str, index: int = 0) -> Mixer:
+        Yields:
+            Mixer objects for this card.
+
+        Raises:
+            ALSAError: If there's an error accessing the card's mixers.
+        """
+        yield from self.list_mixers()
+
+    def get_mixer(self, name: str, index: int = 0, verify: bool = False) -> Mixer:
         """
         Get a mixer element by name.
 
+        Without verification a missing element is only reported (as ALSAError)
+        when the returned Mixer is first used.
+
         Args:
             name: Mixer element name (e.g., "Master", "PCM")
             index: Mixer element index (default: 0)
+            verify: Check that the element exists before returning (default: False)
 
         Returns:
             Mixer object
 
         Raises:
-            ALSAError: If mixer element doesn't exist
+            ALSAError: If verify is set and mixer element doesn't exist
         """
         mixer = Mixer(card=self, name=name, index=index)
-        # Verify the mixer exists by accessing it
-        with mixer._make_alsa_elem():
-            pass
+        if verify:
+            # Verify the mixer exists by accessing it
+            with mixer._make_alsa_elem():
+                pass
         return mixer
 
 
@@ -378,7 +819,22 @@ def iter_cards() -> Iterator[Card]:
     """
     card = c_int(-1)
     while True:
-        _check_error(_lib.snd_card_next(byref(card)), "Error enumerating cards")
+        err = _lib.snd_card_next(byref(card))
+        if err < 0:
+            raise _alsa_error(err, "Error enumerating cards")
         if card.value == -1:
             break
         yield Card(card.value)
+
+
+def list_cards() -> list[Card]:
+    """
+    List all available ALSA sound cards.
+
+    Returns:
+        Card objects representing available sound cards.
+
+    Raises:
+        ALSAError: If there's an error accessing the sound cards.
+    """
+    return list(iter_cards())
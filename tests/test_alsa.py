@@ -0,0 +1,252 @@
+"""Tests for pythonalsa.alsa, run against a stub libasound."""
+
+import os
+import select
+import unittest
+from typing import Callable
+from unittest import mock
+
+
+class _FakeFunc:
+    """Stub libasound function recording its calls."""
+
+    def __init__(self, result: int):
+        self.result = result
+        self.action: Callable | None = None
+        self.calls: list[tuple] = []
+
+    def __call__(self, *args):
+        self.calls.append(args)
+        if self.action is not None:
+            self.action(*args)
+        return self.result
+
+
+class _FakeLib:
+    """Stub libasound where every call succeeds and every lookup finds an element."""
+
+    _RESULTS = {
+        "snd_mixer_find_selem": 1,
+        "snd_mixer_selem_has_playback_volume": 1,
+    }
+
+    def __init__(self, name):
+        pass
+
+    def __getattr__(self, name: str) -> _FakeFunc:
+        if name.endswith("_sizeof"):
+            result = 64
+        else:
+            result = self._RESULTS.get(name, 0)
+        func = _FakeFunc(result)
+        setattr(self, name, func)
+        return func
+
+
+with mock.patch("ctypes.CDLL", _FakeLib):
+    from pythonalsa import alsa
+
+
+class StubLibTestCase(unittest.TestCase):
+    def setUp(self):
+        for func in vars(alsa._lib).values():
+            func.calls.clear()
+
+    def stub(self, name: str, result: int | None = None, action=None) -> None:
+        """Override a stub function's result and/or action for this test."""
+        func = getattr(alsa._lib, name)
+        if result is not None:
+            self.addCleanup(setattr, func, "result", func.result)
+            func.result = result
+        if action is not None:
+            self.addCleanup(setattr, func, "action", func.action)
+            func.action = action
+
+    def count(self, name: str) -> int:
+        return len(getattr(alsa._lib, name).calls)
+
+
+class CachedCardTest(StubLibTestCase):
+    def setUp(self):
+        super().setUp()
+        self.card = alsa.Card(0, cached=True)
+        self.addCleanup(self.card.close)
+        self.mixer = self.card.get_mixer("Master")
+
+    def test_repeated_reads_reuse_handle_and_element(self):
+        self.mixer.volume
+        self.mixer.volume
+        self.mixer.volume_range
+        self.assertEqual(self.count("snd_mixer_open"), 1)
+        self.assertEqual(self.count("snd_mixer_find_selem"), 1)
+        self.assertEqual(self.count("snd_mixer_close"), 0)
+
+    def test_events_clear_element_cache(self):
+        self.mixer.volume
+        self.stub("snd_mixer_handle_events", result=1)
+        self.mixer.volume
+        self.assertEqual(self.count("snd_mixer_open"), 1)
+        self.assertEqual(self.count("snd_mixer_find_selem"), 2)
+
+    def test_close_releases_handle_and_reopens_lazily(self):
+        self.mixer.volume
+        self.card.close()
+        self.assertEqual(self.count("snd_mixer_close"), 1)
+        self.card.close()
+        self.assertEqual(self.count("snd_mixer_close"), 1)
+
+        self.mixer.volume
+        self.assertEqual(self.count("snd_mixer_open"), 2)
+        self.assertEqual(self.count("snd_mixer_find_selem"), 2)
+
+    def test_index_change_invalidates_handle(self):
+        self.mixer.volume
+        self.card.index = 1
+        self.assertEqual(self.count("snd_mixer_close"), 1)
+
+        self.mixer.volume
+        self.assertEqual(self.count("snd_mixer_open"), 2)
+        self.assertEqual(self.count("snd_mixer_find_selem"), 2)
+        self.assertEqual(alsa._lib.snd_mixer_attach.calls[-1][1], b"hw:1")
+
+    def test_uncached_card_reopens_every_access(self):
+        mixer = alsa.Card(0).get_mixer("Master")
+        mixer.volume
+        mixer.volume
+        self.assertEqual(self.count("snd_mixer_open"), 2)
+        self.assertEqual(self.count("snd_mixer_close"), 2)
+
+
+class WaitForEventTest(StubLibTestCase):
+    def setUp(self):
+        super().setUp()
+        self.card = alsa.Card(0, cached=True)
+        self.addCleanup(self.card.close)
+
+    def stub_poll_descriptor(self) -> None:
+        """Report one readable pipe as the mixer's poll descriptor."""
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        os.write(write_fd, b"x")
+
+        def fill(handle, pfds, count):
+            pfds[0].fd = read_fd
+            pfds[0].events = select.POLLIN
+
+        self.stub("snd_mixer_poll_descriptors_count", result=1)
+        self.stub("snd_mixer_poll_descriptors", result=1, action=fill)
+
+    def test_no_poll_descriptors_raises(self):
+        with self.assertRaises(alsa.ALSAError):
+            self.card.wait_for_event()
+
+    def test_wakeup_without_events_returns_false(self):
+        self.stub_poll_descriptor()
+        self.assertFalse(self.card.wait_for_event(1))
+        self.assertEqual(self.count("snd_mixer_poll_descriptors_revents"), 1)
+
+    def test_wakeup_with_events_returns_true(self):
+        self.stub_poll_descriptor()
+        events = alsa._lib.snd_mixer_handle_events
+        self.addCleanup(setattr, events, "result", events.result)
+        self.stub(
+            "snd_mixer_poll_descriptors_revents",
+            action=lambda *args: setattr(events, "result", 1),
+        )
+        self.assertTrue(self.card.wait_for_event(1))
+
+
+class GetMixerTest(StubLibTestCase):
+    def test_default_does_not_open_mixer(self):
+        self.stub("snd_mixer_find_selem", result=0)
+        mixer = alsa.Card(0).get_mixer("Missing")
+        self.assertEqual(mixer.name, "Missing")
+        self.assertEqual(self.count("snd_mixer_open"), 0)
+        self.assertEqual(self.count("snd_mixer_find_selem"), 0)
+
+    def test_verify_raises_for_missing_element(self):
+        self.stub("snd_mixer_find_selem", result=0)
+        with self.assertRaises(alsa.ALSAError):
+            alsa.Card(0).get_mixer("Missing", verify=True)
+        self.assertEqual(self.count("snd_mixer_open"), 1)
+        self.assertEqual(self.count("snd_mixer_close"), 1)
+
+    def test_verify_accepts_existing_element(self):
+        mixer = alsa.Card(0).get_mixer("Master", verify=True)
+        self.assertEqual(mixer.name, "Master")
+        self.assertEqual(self.count("snd_mixer_find_selem"), 1)
+
+
+class VolumePercentTest(StubLibTestCase):
+    def setUp(self):
+        super().setUp()
+
+        def fill_range(elem, pmin, pmax):
+            pmin._obj.value = 0
+            pmax._obj.value = 87
+
+        self.stub("snd_mixer_selem_get_playback_volume_range", action=fill_range)
+        self.mixer = alsa.Card(0).get_mixer("Master")
+
+    def set_raw_volume(self, value) -> int:
+        self.mixer.volume_percent = value
+        return alsa._lib.snd_mixer_selem_set_playback_volume_all.calls[-1][1]
+
+    def test_set_int(self):
+        raw = self.set_raw_volume(75)
+        self.assertEqual(raw, 65)
+        self.assertIs(type(raw), int)
+
+    def test_set_float(self):
+        raw = self.set_raw_volume(75.0)
+        self.assertEqual(raw, 65)
+        self.assertIs(type(raw), int)
+        self.assertEqual(self.set_raw_volume(74.6), 65)
+
+    def test_set_out_of_range_raises(self):
+        with self.assertRaises(ValueError):
+            self.mixer.volume_percent = 100.5
+
+
+class VolumePollerTest(StubLibTestCase):
+    def make_poller(self) -> alsa.VolumePoller:
+        return alsa.Mixer(alsa.Card(0), "Master").make_poller()
+
+    def test_read_after_close_raises(self):
+        poller = self.make_poller()
+        self.assertEqual(poller.read(), 0)
+        poller.close()
+        events_calls = self.count("snd_mixer_handle_events")
+
+        with self.assertRaises(alsa.ALSAError):
+            poller.read()
+        self.assertEqual(self.count("snd_mixer_handle_events"), events_calls)
+
+    def test_read_after_context_exit_raises(self):
+        with self.make_poller() as poller:
+            poller.read()
+        with self.assertRaises(alsa.ALSAError):
+            poller.read()
+
+    def test_read_looks_up_element_again_after_events(self):
+        poller = self.make_poller()
+        self.addCleanup(poller.close)
+        poller.read()
+        self.assertEqual(self.count("snd_mixer_find_selem"), 1)
+
+        self.stub("snd_mixer_handle_events", result=1)
+        poller.read()
+        self.assertEqual(self.count("snd_mixer_find_selem"), 2)
+
+    def test_read_raises_when_element_removed(self):
+        poller = self.make_poller()
+        self.addCleanup(poller.close)
+        self.stub("snd_mixer_handle_events", result=1)
+        self.stub("snd_mixer_find_selem", result=0)
+        with self.assertRaises(alsa.ALSAError):
+            poller.read()
+
+
+if __name__ == "__main__":
+    unittest.main()